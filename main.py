@@ -1,15 +1,46 @@
+import asyncio
+import json
 import os
+from bisect import bisect_right
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from email.utils import formatdate
+from functools import lru_cache
 from typing import List, Optional
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
+from bson.errors import InvalidId
 from bson.objectid import ObjectId
-import requests
+from cachetools import TTLCache
+import httpx
+import numpy as np
+import orjson
+import redis.asyncio as aioredis
 
 from database import db, create_document, get_documents
 from schemas import Cat
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One pooled client for the app's lifetime: keep-alive connections and
+    # HTTP/2 multiplexing avoid a fresh TCP+TLS handshake per weather call.
+    app.state.http = httpx.AsyncClient(
+        timeout=15,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        http2=True,
+    )
+    refresher = asyncio.create_task(_refresh_weather_cache())
+    yield
+    refresher.cancel()
+    await app.state.http.aclose()
+
+
+# orjson encodes the nested dashboard payload several times faster than
+# stdlib json, so make it the default for every endpoint.
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -21,59 +52,241 @@ app.add_middleware(
 
 # -------- Utilities ---------
 
+@lru_cache(maxsize=4096)
+def _parse_object_id(id_str: str) -> ObjectId:
+    # ObjectId is immutable, so caching parsed ids is safe; hot cat_ids
+    # polled by dashboards skip re-parsing the hex string every request.
+    return ObjectId(id_str)
+
+
 def to_object_id(id_str: str) -> ObjectId:
     try:
-        return ObjectId(id_str)
-    except Exception:
+        return _parse_object_id(id_str)
+    except (InvalidId, TypeError):
         raise HTTPException(status_code=400, detail="Invalid id format")
 
 
-def fetch_weather(lat: float, lon: float):
-    # Using Open-Meteo (no API key required)
-    url = (
-        "https://api.open-meteo.com/v1/forecast"
-        f"?latitude={lat}&longitude={lon}"
-        "&current=temperature_2m,apparent_temperature,wind_speed_10m,precipitation,is_day"
-        "&hourly=temperature_2m,apparent_temperature,precipitation_probability,weather_code"
-        "&timezone=auto"
-    )
-    r = requests.get(url, timeout=15)
-    r.raise_for_status()
-    return r.json()
+# Optional Redis cache for Open-Meteo responses (set REDIS_URL to enable)
+redis_client = None
+redis_url = os.getenv("REDIS_URL")
+if redis_url:
+    redis_client = aioredis.from_url(redis_url, decode_responses=True)
 
+# Fresh entries expire quickly; a stale copy is kept longer as a fallback
+# when the upstream weather API is unreachable.
+WEATHER_CACHE_TTL = int(os.getenv("WEATHER_CACHE_TTL", 300))
+WEATHER_STALE_TTL = int(os.getenv("WEATHER_STALE_TTL", 3600))
 
-def coat_recommendation(temp_c: float, wind_kmh: float, precipitation_mm: float, is_day: bool):
-    # Simple heuristic tailored for cats
-    # Convert to human-friendly bands
-    # Consider wind chill by nudging temp down if windy
+# Full dashboard response cache: the payload is expensive (Mongo read +
+# N weather fetches) but changes slowly, so serve the serialized bytes
+# straight from Redis within the TTL. Bump the key version on schema change.
+DASHBOARD_CACHE_KEY = "dash:v1"
+DASHBOARD_CACHE_TTL = int(os.getenv("DASHBOARD_CACHE_TTL", 90))
+DASHBOARD_STALE_TTL = int(os.getenv("DASHBOARD_STALE_TTL", 3600))
+
+# Short-lived per-cat cache of the full /api/recommendations payload
+REC_CACHE_TTL = int(os.getenv("REC_CACHE_TTL", 60))
+
+# How often the background task prewarms weather for all known locations
+WEATHER_REFRESH_INTERVAL = int(os.getenv("WEATHER_REFRESH_INTERVAL", 300))
+
+
+# Open-Meteo endpoint (no API key required); only lat/lon vary per call,
+# so the fixed query parameters live in one constant dict.
+_WX_URL = "https://api.open-meteo.com/v1/forecast"
+_WX_PARAMS = {
+    "current": "temperature_2m,apparent_temperature,wind_speed_10m,precipitation,is_day",
+    "hourly": "temperature_2m,apparent_temperature,precipitation_probability,weather_code",
+    "timezone": "auto",
+}
+
+
+def _weather_cache_key(lat: float, lon: float) -> str:
+    # Round so nearby coordinates (same city) share one cache entry
+    return f"wx:{round(lat, 2)}:{round(lon, 2)}"
+
+
+# In-process L1 cache in front of Redis, plus coalescing of concurrent
+# identical lookups so only one upstream call is in flight per location.
+_weather_l1: TTLCache = TTLCache(maxsize=1024, ttl=60)
+_weather_inflight: dict = {}
+
+
+async def fetch_weather_async(client: httpx.AsyncClient, lat: float, lon: float):
+    # Async variant of fetch_weather for endpoints that fan out many lookups.
+    # Checks the in-process cache first, coalesces concurrent identical
+    # requests onto a single in-flight future, then falls back to Redis
+    # and finally the upstream API.
+    k = (round(lat, 2), round(lon, 2))
+    if k in _weather_l1:
+        return _weather_l1[k]
+    if k in _weather_inflight:
+        return await _weather_inflight[k]
+
+    future = asyncio.get_running_loop().create_future()
+    _weather_inflight[k] = future
+    try:
+        data = await _fetch_weather_uncached(client, lat, lon)
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    else:
+        _weather_l1[k] = data
+        future.set_result(data)
+        return data
+    finally:
+        _weather_inflight.pop(k, None)
+        if not future.done():
+            # Leader was cancelled before resolving (CancelledError skips
+            # the except clause); release any coalesced waiters.
+            future.cancel()
+        elif not future.cancelled() and future.exception() is not None:
+            # Avoid "exception was never retrieved" warnings when nobody awaited
+            future.exception()
+
+
+async def _fetch_weather_uncached(client: httpx.AsyncClient, lat: float, lon: float):
+    # Redis-backed fetch: repeated lookups for the same (rounded)
+    # coordinates skip the upstream round-trip entirely. The stale copy is
+    # stored as {"fetched_at": <http-date>, "body": ...} so refreshes can
+    # revalidate with If-Modified-Since instead of re-downloading.
+    key = _weather_cache_key(lat, lon)
+    stale_entry = None
+    if redis_client is not None:
+        try:
+            cached = await redis_client.get(key)
+            if cached:
+                return json.loads(cached)
+            stale = await redis_client.get(key + ":stale")
+            if stale:
+                stale_entry = json.loads(stale)
+        except Exception:
+            pass  # cache unavailable; fall through to the live fetch
+
+    headers = {}
+    if isinstance(stale_entry, dict) and "fetched_at" in stale_entry:
+        headers["If-Modified-Since"] = stale_entry["fetched_at"]
+    try:
+        r = await client.get(
+            _WX_URL,
+            params={**_WX_PARAMS, "latitude": lat, "longitude": lon},
+            headers=headers,
+        )
+        if r.status_code == 304 and stale_entry is not None:
+            # Unchanged upstream: reuse the stored body and re-freshen it
+            data = stale_entry["body"]
+            if redis_client is not None:
+                try:
+                    await redis_client.setex(key, WEATHER_CACHE_TTL, json.dumps(data))
+                    await redis_client.expire(key + ":stale", WEATHER_STALE_TTL)
+                except Exception:
+                    pass
+            return data
+        r.raise_for_status()
+    except httpx.HTTPError:
+        # Upstream failed: serve the stale copy if we still have one
+        if isinstance(stale_entry, dict) and "body" in stale_entry:
+            return stale_entry["body"]
+        raise
+    data = r.json()
+
+    if redis_client is not None:
+        try:
+            fetched_at = r.headers.get("date") or formatdate(usegmt=True)
+            await redis_client.setex(key, WEATHER_CACHE_TTL, json.dumps(data))
+            await redis_client.setex(
+                key + ":stale",
+                WEATHER_STALE_TTL,
+                json.dumps({"fetched_at": fetched_at, "body": data}),
+            )
+        except Exception:
+            pass
+    return data
+
+
+async def _refresh_weather_cache():
+    """Prewarm the weather cache for every known cat location.
+
+    Runs for the app's lifetime, refreshing all unique (lat, lon) pairs
+    every WEATHER_REFRESH_INTERVAL seconds so user-facing requests almost
+    always hit a warm cache instead of paying the upstream round-trip.
+    """
+    while True:
+        await asyncio.sleep(WEATHER_REFRESH_INTERVAL)
+        try:
+            if db is None:
+                continue
+            if redis_client is not None:
+                # With multiple workers, let only one do the refresh round
+                try:
+                    acquired = await redis_client.set(
+                        "wx:refresh-lock", "1", nx=True, ex=WEATHER_REFRESH_INTERVAL
+                    )
+                    if not acquired:
+                        continue
+                except Exception:
+                    pass
+            pairs = await db["cat"].aggregate([
+                {"$group": {"_id": {"lat": "$latitude", "lon": "$longitude"}}}
+            ]).to_list(length=None)
+            # fetch_weather_async populates the caches as a side effect
+            await asyncio.gather(
+                *[
+                    fetch_weather_async(
+                        app.state.http, float(p["_id"]["lat"]), float(p["_id"]["lon"])
+                    )
+                    for p in pairs
+                ],
+                return_exceptions=True,
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            continue  # never let a bad round kill the refresher
+
+
+# Coat bands for the wind-adjusted temperature: band i applies when
+# adjusted < _COAT_THRESHOLDS[i]; the last entry is the "warm" catch-all.
+_COAT_THRESHOLDS = [-5.0, 5.0, 12.0, 20.0]
+_COAT_TABLE = [
+    ("Thermal coat + booties", "Very cold. Limit outdoor time."),
+    ("Insulated coat", "Chilly. Keep sessions short."),
+    ("Light coat", "Cool but manageable."),
+    ("No coat, optional light vest", "Comfortable temps."),
+    ("No coat", "Warm. Provide shade and water."),
+]
+_PRECIP_NOTES = ("Rainy", "Drizzly", "Dry")
+
+
+@lru_cache(maxsize=8192)
+def _coat_core(temp_c: float, wind_kmh: float, precipitation_mm: float):
+    # Day/night-independent part of the heuristic, memoized on quantized
+    # inputs: the output table is tiny, so cats across a city collapse
+    # onto a handful of cache entries. Returns an immutable tuple.
     adjusted = temp_c - (0.1 * wind_kmh / 5.0)
 
     if precipitation_mm >= 1.0:
-        precip_note = "Rainy"
+        precip_note = _PRECIP_NOTES[0]
     elif precipitation_mm > 0.1:
-        precip_note = "Drizzly"
+        precip_note = _PRECIP_NOTES[1]
     else:
-        precip_note = "Dry"
+        precip_note = _PRECIP_NOTES[2]
+
+    coat, note = _COAT_TABLE[bisect_right(_COAT_THRESHOLDS, adjusted)]
+    return round(adjusted, 1), precip_note, coat, note
+
+
+def coat_recommendation(temp_c: float, wind_kmh: float, precipitation_mm: float, is_day: bool):
+    # Simple heuristic tailored for cats
+    # Consider wind chill by nudging temp down if windy
+    # Quantize inputs so near-identical readings share a cache entry
+    adjusted, precip_note, coat, note = _coat_core(
+        round(temp_c, 1), round(wind_kmh, 0), round(precipitation_mm, 1)
+    )
 
     # Day vs Night nuance (outside vs inside rug)
     context = "Day (outside rug)" if is_day else "Night (inside rug)"
 
-    if adjusted < -5:
-        coat = "Thermal coat + booties"
-        note = "Very cold. Limit outdoor time."
-    elif adjusted < 5:
-        coat = "Insulated coat"
-        note = "Chilly. Keep sessions short."
-    elif adjusted < 12:
-        coat = "Light coat"
-        note = "Cool but manageable."
-    elif adjusted < 20:
-        coat = "No coat, optional light vest"
-        note = "Comfortable temps."
-    else:
-        coat = "No coat"
-        note = "Warm. Provide shade and water."
-
     if not is_day:
         # At night, many cats are indoors; suggest rug/blanket context
         note += " Use a cozy indoor rug/blanket for naps."
@@ -83,10 +296,85 @@ def coat_recommendation(temp_c: float, wind_kmh: float, precipitation_mm: float,
         "coat": coat,
         "note": note,
         "precip": precip_note,
-        "adjusted_temp_c": round(adjusted, 1),
+        "adjusted_temp_c": adjusted,
     }
 
 
+def coat_recommendations_both(temp_c: float, wind_kmh: float, precipitation_mm: float):
+    # Day and night share everything except context and the night suffix,
+    # so run the core heuristic once and assemble both dicts from it.
+    adjusted, precip_note, coat, note = _coat_core(
+        round(temp_c, 1), round(wind_kmh, 0), round(precipitation_mm, 1)
+    )
+    return {
+        "day": {
+            "context": "Day (outside rug)",
+            "coat": coat,
+            "note": note,
+            "precip": precip_note,
+            "adjusted_temp_c": adjusted,
+        },
+        "night": {
+            "context": "Night (inside rug)",
+            "coat": coat,
+            # At night, many cats are indoors; suggest rug/blanket context
+            "note": note + " Use a cozy indoor rug/blanket for naps.",
+            "precip": precip_note,
+            "adjusted_temp_c": adjusted,
+        },
+    }
+
+
+def coat_recommendations_batch(temps, winds, precips):
+    """Vectorized coat_recommendation for the dashboard bulk path.
+
+    Computes the adjusted temperature, coat band and precip band for all
+    cats at once with NumPy, then returns one {"day": ..., "night": ...}
+    pair per cat so each cat needs a single lookup instead of two full
+    recomputations.
+    """
+    if not temps:
+        return []
+
+    # Quantize with the same Python round as the scalar path so both
+    # endpoints render identical recommendations for the same readings
+    t = np.asarray([round(x, 1) for x in temps], dtype=float)
+    w = np.asarray([round(x, 0) for x in winds], dtype=float)
+    p = np.asarray([round(x, 1) for x in precips], dtype=float)
+
+    adjusted = t - (0.1 * w / 5.0)
+    coat_idx = np.searchsorted(_COAT_THRESHOLDS, adjusted, side="right")
+    precip_idx = np.where(p >= 1.0, 0, np.where(p > 0.1, 1, 2))
+
+    out = []
+    for adj, ci, pi in zip(adjusted, coat_idx, precip_idx):
+        coat, note = _COAT_TABLE[ci]
+        precip_note = _PRECIP_NOTES[pi]
+        adj_rounded = round(float(adj), 1)
+        out.append({
+            "day": {
+                "context": "Day (outside rug)",
+                "coat": coat,
+                "note": note,
+                "precip": precip_note,
+                "adjusted_temp_c": adj_rounded,
+            },
+            "night": {
+                "context": "Night (inside rug)",
+                "coat": coat,
+                "note": note + " Use a cozy indoor rug/blanket for naps.",
+                "precip": precip_note,
+                "adjusted_temp_c": adj_rounded,
+            },
+        })
+    return out
+
+
+# Only the fields the cat endpoints actually render; keeps Mongo from
+# shipping (and Python from decoding) anything else in each document.
+CAT_PROJECTION = {"name": 1, "city": 1, "notes": 1, "latitude": 1, "longitude": 1}
+
+
 # -------- Models ----------
 
 class CatCreate(BaseModel):
@@ -106,44 +394,60 @@ def read_root():
 
 
 @app.get("/api/cats")
-def list_cats():
-    cats = get_documents("cat")
-    # Convert ObjectId to string
-    for c in cats:
-        c["id"] = str(c.get("_id"))
-        c.pop("_id", None)
-    return {"cats": cats}
+async def list_cats():
+    if db is None:
+        raise HTTPException(status_code=500, detail="Database not available")
+    # Let Mongo stringify the ObjectId in the projection so the docs come
+    # back ready to serialize, with no Python-side rewrite pass.
+    cursor = db["cat"].aggregate([
+        {"$project": {"id": {"$toString": "$_id"}, "_id": 0, **CAT_PROJECTION}}
+    ])
+    return {"cats": await cursor.to_list(length=None)}
 
 
 @app.post("/api/cats")
-def create_cat(payload: CatCreate):
+async def create_cat(payload: CatCreate):
     cat = Cat(**payload.model_dump())
-    new_id = create_document("cat", cat)
+    new_id = await create_document("cat", cat)
     return {"id": new_id}
 
 
 @app.delete("/api/cats/{cat_id}")
-def delete_cat(cat_id: str):
+async def delete_cat(cat_id: str):
     if db is None:
         raise HTTPException(status_code=500, detail="Database not available")
-    result = db["cat"].delete_one({"_id": to_object_id(cat_id)})
+    result = await db["cat"].delete_one({"_id": to_object_id(cat_id)})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Cat not found")
     return {"status": "deleted"}
 
 
 @app.get("/api/recommendations/{cat_id}")
-def get_recommendation(cat_id: str):
+async def get_recommendation(cat_id: str):
     if db is None:
         raise HTTPException(status_code=500, detail="Database not available")
-    doc = db["cat"].find_one({"_id": to_object_id(cat_id)})
+    doc = await db["cat"].find_one({"_id": to_object_id(cat_id)}, CAT_PROJECTION)
     if not doc:
         raise HTTPException(status_code=404, detail="Cat not found")
 
-    lat = float(doc["latitude"]) 
-    lon = float(doc["longitude"]) 
-
-    weather = fetch_weather(lat, lon)
+    lat = float(doc["latitude"])
+    lon = float(doc["longitude"])
+
+    rec_key = f"rec:{cat_id}"
+    if redis_client is not None:
+        # Overlap the weather fetch with the cached-payload lookup; if the
+        # cached payload is still fresh we return it as-is.
+        weather, cached = await asyncio.gather(
+            fetch_weather_async(app.state.http, lat, lon),
+            redis_client.get(rec_key),
+            return_exceptions=True,
+        )
+        if isinstance(cached, str) and cached:
+            return Response(content=cached, media_type="application/json")
+        if isinstance(weather, BaseException):
+            raise weather
+    else:
+        weather = await fetch_weather_async(app.state.http, lat, lon)
     current = weather.get("current", {})
 
     temp_c = float(current.get("temperature_2m", 0))
@@ -151,8 +455,7 @@ def get_recommendation(cat_id: str):
     precipitation_mm = float(current.get("precipitation", 0))
     is_day = bool(current.get("is_day", 1))
 
-    rec_day = coat_recommendation(temp_c, wind_kmh, precipitation_mm, True)
-    rec_night = coat_recommendation(temp_c, wind_kmh, precipitation_mm, False)
+    recs = coat_recommendations_both(temp_c, wind_kmh, precipitation_mm)
 
     payload = {
         "cat": {
@@ -168,28 +471,100 @@ def get_recommendation(cat_id: str):
             "precipitation_mm": precipitation_mm,
             "is_day": is_day,
         },
-        "recommendations": {
-            "day": rec_day,
-            "night": rec_night,
-        },
+        "recommendations": recs,
     }
+    if redis_client is not None:
+        try:
+            await redis_client.setex(rec_key, REC_CACHE_TTL, orjson.dumps(payload))
+        except Exception:
+            pass
     return payload
 
 
 @app.get("/api/dashboard")
-def dashboard():
+async def dashboard():
+    # Serve the whole serialized payload from Redis when fresh
+    if redis_client is not None:
+        try:
+            hit = await redis_client.get(DASHBOARD_CACHE_KEY)
+            if hit:
+                return Response(content=hit, media_type="application/json")
+        except Exception:
+            pass
+
+    try:
+        payload = await _build_dashboard()
+    except Exception:
+        # Fall back to the stale copy if the rebuild failed outright
+        if redis_client is not None:
+            try:
+                stale = await redis_client.get(DASHBOARD_CACHE_KEY + ":stale")
+                if stale:
+                    return Response(
+                        content=stale,
+                        media_type="application/json",
+                        headers={"X-Cache": "STALE"},
+                    )
+            except Exception:
+                pass
+        raise
+
+    if redis_client is not None:
+        try:
+            body = orjson.dumps(payload)
+            await redis_client.setex(DASHBOARD_CACHE_KEY, DASHBOARD_CACHE_TTL, body)
+            await redis_client.setex(DASHBOARD_CACHE_KEY + ":stale", DASHBOARD_STALE_TTL, body)
+        except Exception:
+            pass
+    return payload
+
+
+def _error_item(doc, exc):
+    # Per-cat error entry: one bad doc or failed fetch must not take down
+    # the rest of the dashboard.
+    return {
+        "cat": {
+            "id": str(doc.get("_id")),
+            "name": doc.get("name"),
+            "city": doc.get("city"),
+        },
+        "error": str(exc)[:120]
+    }
+
+
+async def _build_dashboard():
     # aggregate all cats with current weather and recs
-    cats = get_documents("cat")
+    cats = await get_documents("cat", projection=CAT_PROJECTION)
+    # Group cats by rounded coordinates and fetch weather once per unique
+    # location, concurrently; cats sharing a city reuse the same result.
+    groups: dict = defaultdict(list)
+    for doc in cats:
+        try:
+            key = (round(float(doc["latitude"]), 3), round(float(doc["longitude"]), 3))
+        except Exception:
+            continue  # surfaces as a per-cat error item below
+        groups[key].append(doc)
+    keys = list(groups)
+    results = await asyncio.gather(
+        *[fetch_weather_async(app.state.http, lat, lon) for lat, lon in keys],
+        return_exceptions=True,
+    )
+    weather_by_key = dict(zip(keys, results))
     items = []
+    temps, winds, precips = [], [], []
     for doc in cats:
         try:
-            weather = fetch_weather(float(doc["latitude"]), float(doc["longitude"]))
+            key = (round(float(doc["latitude"]), 3), round(float(doc["longitude"]), 3))
+            result = weather_by_key[key]
+            if isinstance(result, Exception):
+                raise result
+            weather = result
             current = weather.get("current", {})
             temp_c = float(current.get("temperature_2m", 0))
             wind_kmh = float(current.get("wind_speed_10m", 0))
             precipitation_mm = float(current.get("precipitation", 0))
             is_day = bool(current.get("is_day", 1))
-            items.append({
+            item = {
                 "cat": {
                     "id": str(doc["_id"]),
                     "name": doc.get("name"),
@@ -203,29 +578,91 @@ def dashboard():
                     "precipitation_mm": precipitation_mm,
                     "is_day": is_day,
                 },
-                "recommendations": {
-                    "day": coat_recommendation(temp_c, wind_kmh, precipitation_mm, True),
-                    "night": coat_recommendation(temp_c, wind_kmh, precipitation_mm, False),
-                }
-            })
+            }
         except Exception as e:
-            items.append({
-                "cat": {
-                    "id": str(doc.get("_id")),
-                    "name": doc.get("name"),
-                    "city": doc.get("city"),
-                },
-                "error": str(e)[:120]
-            })
+            items.append(_error_item(doc, e))
+        else:
+            temps.append(temp_c)
+            winds.append(wind_kmh)
+            precips.append(precipitation_mm)
+            items.append(item)
+    # Compute day+night recommendations for all cats in one vectorized pass
+    recs = iter(coat_recommendations_batch(temps, winds, precips))
+    for item in items:
+        if "error" not in item:
+            item["recommendations"] = next(recs)
     return {"items": items}
 
 
+@app.get("/api/dashboard/stream")
+async def dashboard_stream():
+    """NDJSON variant of the dashboard: one line per cat, emitted as soon
+    as that cat's location resolves, so clients can render long before the
+    slowest upstream call returns. /api/dashboard keeps serving the
+    aggregated (and cached) JSON payload."""
+    cats = await get_documents("cat", projection=CAT_PROJECTION)
+    groups: dict = defaultdict(list)
+    bad_docs = []  # cats whose coordinates can't be parsed
+    for doc in cats:
+        try:
+            key = (round(float(doc["latitude"]), 3), round(float(doc["longitude"]), 3))
+        except Exception as e:
+            bad_docs.append((doc, e))
+            continue
+        groups[key].append(doc)
+
+    async def fetch_group(key):
+        lat, lon = key
+        try:
+            return key, await fetch_weather_async(app.state.http, lat, lon)
+        except Exception as e:
+            return key, e
+
+    async def generate():
+        for doc, exc in bad_docs:
+            yield orjson.dumps(_error_item(doc, exc)) + b"\n"
+        tasks = [asyncio.ensure_future(fetch_group(key)) for key in groups]
+        for next_done in asyncio.as_completed(tasks):
+            key, result = await next_done
+            for doc in groups[key]:
+                try:
+                    if isinstance(result, Exception):
+                        raise result
+                    current = result.get("current", {})
+                    temp_c = float(current.get("temperature_2m", 0))
+                    wind_kmh = float(current.get("wind_speed_10m", 0))
+                    precipitation_mm = float(current.get("precipitation", 0))
+                    item = {
+                        "cat": {
+                            "id": str(doc["_id"]),
+                            "name": doc.get("name"),
+                            "city": doc.get("city"),
+                            "notes": doc.get("notes"),
+                        },
+                        "weather": {
+                            "temperature_c": temp_c,
+                            "apparent_c": float(current.get("apparent_temperature", temp_c)),
+                            "wind_kmh": wind_kmh,
+                            "precipitation_mm": precipitation_mm,
+                            "is_day": bool(current.get("is_day", 1)),
+                        },
+                        "recommendations": coat_recommendations_both(
+                            temp_c, wind_kmh, precipitation_mm
+                        ),
+                    }
+                except Exception as e:
+                    item = _error_item(doc, e)
+                yield orjson.dumps(item) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @app.post("/api/seed")
-def seed_dummy():
+async def seed_dummy():
     """Seed the database with a few demo cats if empty."""
     if db is None:
         raise HTTPException(status_code=500, detail="Database not available")
-    count = db["cat"].count_documents({})
+    count = await db["cat"].count_documents({})
     if count > 0:
         return {"status": "skipped", "count": count}
 
@@ -236,12 +673,12 @@ def seed_dummy():
     ]
     ids: List[str] = []
     for c in demo:
-        ids.append(create_document("cat", c))
+        ids.append(await create_document("cat", c))
     return {"status": "seeded", "count": len(ids), "ids": ids}
 
 
 @app.get("/test")
-def test_database():
+async def test_database():
     response = {
         "backend": "✅ Running",
         "database": "❌ Not Available",
@@ -258,7 +695,7 @@ def test_database():
             response["database_name"] = db.name if hasattr(db, 'name') else "✅ Connected"
             response["connection_status"] = "Connected"
             try:
-                collections = db.list_collection_names()
+                collections = await db.list_collection_names()
                 response["collections"] = collections[:10]
                 response["database"] = "✅ Connected & Working"
             except Exception as e:
@@ -278,4 +715,13 @@ def test_database():
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # uvloop + httptools swap the event loop and HTTP parser for their
+    # C implementations; workers > 1 requires the import-string form.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", 2)),
+    )